@@ -1,39 +1,110 @@
 import pandas as pd
+import numpy as np
+import logging
 import os
 
-def extract_data(file_path):
+logger = logging.getLogger(__name__)
+
+# PyArrow is optional: when installed it gives a multithreaded CSV reader and
+# Arrow-backed string columns, otherwise the default C parser is used
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+    STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    CSV_ENGINE = 'c'
+    STRING_DTYPE = object
+
+# Known column types, so the reader does not have to infer them. quantity
+# and price are left to inference so transform_data can coerce bad values
+# instead of the whole read failing. The pyarrow engine is not given these:
+# with a partial dtype= mapping, newer pandas casts every column it infers,
+# and an empty cell in an integer column then fails the whole read. They
+# are applied after reading instead.
+COLUMN_TYPES = {
+    'product_name': STRING_DTYPE,
+    'region': STRING_DTYPE,
+}
+DATE_COLUMNS = ['order_date']
+
+
+def _column_contiguous(data):
+    """
+    Make sure every NumPy-backed column is contiguous in memory
+    
+    pandas stores same-dtype columns together in 2D blocks shaped
+    (columns, rows). read_csv builds those blocks C-ordered, so each column
+    is already one contiguous run; a Fortran-ordered block (e.g. one that
+    views a transposed array) would make every column scan strided. copy()
+    rebuilds the blocks in C order.
+    """
+    for column in data.columns:
+        values = data[column].values
+        if isinstance(values, np.ndarray) and not values.flags.c_contiguous:
+            return data.copy()
+    return data
+
+
+def _read_chunks(reader):
+    """Yield column-contiguous chunks from a chunked CSV reader"""
+    with reader:
+        for chunk in reader:
+            yield _column_contiguous(chunk)
+
+
+def extract_data(file_path, chunksize=None):
     """
     Extract data from CSV file
     
     Args:
         file_path: Path to the CSV file
+        chunksize: If set, stream the file in chunks of this many rows
         
     Returns:
-        pandas DataFrame with the data
+        pandas DataFrame with the data, or an iterator of DataFrame chunks
+        when chunksize is set
     """
     
-    print(f"[INFO] Starting data extraction...")
-    print(f"[INFO] Reading file: {file_path}")
+    logger.info("Starting data extraction...")
+    logger.info("Reading file: %s", file_path)
     
     # Check if file exists
     if not os.path.exists(file_path):
-        print(f"[ERROR] File not found: {file_path}")
+        logger.error("File not found: %s", file_path)
         return None
     
     # Read CSV file
     try:
-        data = pd.read_csv(file_path)
-        print(f"[SUCCESS] Extracted {len(data)} rows")
-        print(f"[INFO] Columns: {list(data.columns)}")
+        if chunksize:
+            # The pyarrow engine cannot read in chunks, so use the C parser
+            reader = pd.read_csv(file_path, chunksize=chunksize,
+                                 dtype=COLUMN_TYPES, parse_dates=DATE_COLUMNS)
+            logger.info("Streaming file in chunks of %s rows", chunksize)
+            return _read_chunks(reader)
+        
+        if CSV_ENGINE == 'pyarrow':
+            # No parse_dates here: pyarrow already decodes ISO dates, and
+            # re-parsing them through pandas is slower than the C engine's
+            # whole read. transform_data converts them with a fixed format.
+            data = pd.read_csv(file_path, engine=CSV_ENGINE)
+            data = data.astype({column: dtype for column, dtype in COLUMN_TYPES.items()
+                                if column in data.columns})
+        else:
+            data = pd.read_csv(file_path, dtype=COLUMN_TYPES, parse_dates=DATE_COLUMNS)
+        data = _column_contiguous(data)
+        logger.info("Extracted %s rows", len(data))
+        logger.info("Columns: %s", list(data.columns))
         return data
     
     except Exception as e:
-        print(f"[ERROR] Failed to read file: {e}")
+        logger.error("Failed to read file: %s", e)
         return None
 
 
 # Test the function
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+    
     # Path to our CSV file
     file_path = "data/raw/sales_data.csv"
     
@@ -1,80 +1,291 @@
 import pandas as pd
+import numpy as np
 import sqlite3
+import itertools
+import logging
 import os
 
-def load_data(df, db_path, table_name):
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+logger = logging.getLogger(__name__)
+
+# Supported warehouse backends
+BACKENDS = ('sqlite', 'duckdb')
+
+# Rows converted to Python values at a time during a bulk load
+INSERT_CHUNK_ROWS = 50_000
+
+# SQLite column affinity for each NumPy dtype kind; anything else is stored as TEXT
+SQLITE_TYPES = {
+    'i': 'INTEGER',
+    'u': 'INTEGER',
+    'b': 'INTEGER',
+    'f': 'REAL',
+}
+
+
+def _sql_values(series):
+    """
+    Convert a column to an array of values sqlite3 can bind directly
+    
+    Datetimes become 'YYYY-MM-DD HH:MM:SS' text (the same format to_sql wrote)
+    and missing values become None.
+    """
+    if series.dtype.kind == 'M':
+        series = series.dt.strftime('%Y-%m-%d %H:%M:%S')
+    
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in SQLITE_TYPES:
+        return series.to_numpy()
+    
+    return series.astype(object).where(series.notna(), None).to_numpy()
+
+
+def _create_table(conn, df, table_name):
+    """
+    Drop and recreate the table with columns typed from the DataFrame dtypes
+    """
+    columns = ", ".join(
+        f'"{name}" {SQLITE_TYPES.get(dtype.kind, "TEXT")}'
+        for name, dtype in df.dtypes.items()
+    )
+    conn.execute(f"DROP TABLE IF EXISTS {table_name}")
+    conn.execute(f"CREATE TABLE {table_name} ({columns})")
+
+
+def _row_tuples(df):
+    """
+    Yield the DataFrame's rows as tuples of sqlite3-bindable values
+    
+    Columns are converted INSERT_CHUNK_ROWS rows at a time, so only one
+    slice of rows exists as Python objects while executemany() consumes them.
+    """
+    for start in range(0, len(df), INSERT_CHUNK_ROWS):
+        chunk = df.iloc[start:start + INSERT_CHUNK_ROWS]
+        columns = [_sql_values(series).tolist() for _, series in chunk.items()]
+        yield from zip(*columns)
+
+
+def resolve_backend(backend):
+    """
+    Return the backend that will actually be used
+    
+    DuckDB is optional; when it is requested but not installed the SQLite
+    path is used instead.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+    
+    if backend == 'duckdb' and duckdb is None:
+        logger.warning("duckdb is not installed, falling back to SQLite")
+        return 'sqlite'
+    
+    return backend
+
+
+def _connect(db_path, backend):
+    """
+    Open a connection to the warehouse database
+    """
+    if backend == 'duckdb':
+        return duckdb.connect(db_path)
+    
+    # Autocommit mode, transactions are explicit
+    return sqlite3.connect(db_path, isolation_level=None)
+
+
+def _write_sqlite(conn, chunks, table_name):
     """
-    Load data into SQLite database
+    Write the chunks into a newly created table, returning the chunk count
+    
+    The table is created from the first chunk, then the rows of every chunk
+    go through one prepared INSERT in a single executemany() call.
+    """
+    chunks = iter(chunks)
+    first = next(chunks, None)
+    if first is None:
+        return 0
+    
+    _create_table(conn, first, table_name)
+    placeholders = ", ".join("?" * len(first.columns))
+    insert_sql = f"INSERT INTO {table_name} VALUES ({placeholders})"
+    
+    chunk_count = 0
+    
+    def rows():
+        nonlocal chunk_count
+        for chunk in itertools.chain([first], chunks):
+            chunk_count += 1
+            yield from _row_tuples(chunk)
+    
+    conn.executemany(insert_sql, rows())
+    return chunk_count
+
+
+def _duckdb_columns(df):
+    """
+    Select list for creating the table, storing every integer column as BIGINT
+    
+    transform_data picks the narrowest integer dtype per chunk, so a later
+    chunk can hold wider values than the first one; BIGINT (the width of
+    SQLite's INTEGER) keeps them from overflowing the column type.
+    """
+    return ", ".join(
+        f'CAST("{name}" AS BIGINT) AS "{name}"' if dtype.kind in 'iu' else f'"{name}"'
+        for name, dtype in df.dtypes.items()
+    )
+
+
+def _write_duckdb(conn, chunks, table_name):
+    """
+    Write the chunks into a newly created table, returning the chunk count
+    
+    DuckDB scans each registered DataFrame directly, so rows are never
+    materialized as Python objects.
+    """
+    chunk_count = 0
+    for chunk in chunks:
+        conn.register('df_view', chunk)
+        try:
+            if chunk_count == 0:
+                conn.execute(f"CREATE OR REPLACE TABLE {table_name} AS "
+                             f"SELECT {_duckdb_columns(chunk)} FROM df_view")
+            else:
+                conn.execute(f"INSERT INTO {table_name} SELECT * FROM df_view")
+        finally:
+            conn.unregister('df_view')
+        chunk_count += 1
+    return chunk_count
+
+
+def _load(conn, chunks, table_name, backend, confirm):
+    """
+    Replace the table with the chunks in a single transaction
+    
+    Returns:
+        Boolean: True if committed, False if confirm rejected the load and
+        it was rolled back
+    """
+    if backend == 'sqlite':
+        # Bulk-load settings: no fsync, rollback journal kept in memory
+        conn.execute("PRAGMA journal_mode=MEMORY")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("PRAGMA temp_store=MEMORY")
+    
+    conn.execute("BEGIN")
+    try:
+        if backend == 'duckdb':
+            chunk_count = _write_duckdb(conn, chunks, table_name)
+        else:
+            chunk_count = _write_sqlite(conn, chunks, table_name)
+        
+        if chunk_count == 0:
+            raise ValueError("No data to load")
+        
+        if confirm is not None and not confirm(conn):
+            conn.execute("ROLLBACK")
+            return False
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    
+    conn.execute("COMMIT")
+    return True
+
+
+def load_data(df, db_path, table_name, backend='sqlite', confirm=None):
+    """
+    Load data into the warehouse database
     
     Args:
-        df: DataFrame to load
-        db_path: Path to SQLite database file
+        df: DataFrame to load, or an iterable of DataFrame chunks
+        db_path: Path to the database file
         table_name: Name of the table to create/replace
+        backend: 'sqlite' or 'duckdb' (falls back to SQLite if duckdb is not installed)
+        confirm: Optional callable, called with the open connection after all
+                 rows are written; the load is rolled back if it returns False
         
     Returns:
         Boolean: True if successful, False otherwise
     """
     
-    print(f"[INFO] Starting data load to database...")
-    print(f"[INFO] Database: {db_path}")
-    print(f"[INFO] Table: {table_name}")
+    backend = resolve_backend(backend)
+    chunks = [df] if isinstance(df, pd.DataFrame) else df
+    
+    logger.info("Starting data load to database...")
+    logger.info("Backend: %s", backend)
+    logger.info("Database: %s", db_path)
+    logger.info("Table: %s", table_name)
     
+    conn = None
     try:
-        # Create connection to SQLite database
-        conn = sqlite3.connect(db_path)
-        print("[INFO] Connected to database")
+        # Create connection to the database
+        conn = _connect(db_path, backend)
+        logger.info("Connected to database")
         
         # Load DataFrame to database
-        df.to_sql(table_name, conn, if_exists='replace', index=False)
+        if not _load(conn, chunks, table_name, backend, confirm):
+            logger.warning("Load was not confirmed, changes rolled back")
+            conn.close()
+            return False
         
         # Verify load
-        cursor = conn.cursor()
-        cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-        row_count = cursor.fetchone()[0]
+        row_count = conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
         
-        print(f"[SUCCESS] Loaded {row_count} rows to table '{table_name}'")
+        logger.info("Loaded %s rows to table '%s'", row_count, table_name)
         
         # Close connection
         conn.close()
-        print("[INFO] Database connection closed")
+        logger.info("Database connection closed")
         
         return True
         
     except Exception as e:
-        print(f"[ERROR] Failed to load data: {e}")
+        logger.error("Failed to load data: %s", e)
+        if conn is not None:
+            conn.close()
         return False
 
 
-def verify_load(db_path, table_name):
+def verify_load(db_path, table_name, backend='sqlite'):
     """
     Verify data was loaded correctly
     
     Args:
         db_path: Path to database
         table_name: Table name to verify
+        backend: 'sqlite' or 'duckdb', as passed to load_data
     """
     
-    print(f"\n[INFO] Verifying data in database...")
+    backend = resolve_backend(backend)
+    
+    logger.info("Verifying data in database...")
     
     try:
-        conn = sqlite3.connect(db_path)
+        conn = _connect(db_path, backend)
         
         # Read data back from database
         query = f"SELECT * FROM {table_name} LIMIT 5"
-        df = pd.read_sql(query, conn)
+        if backend == 'duckdb':
+            df = conn.execute(query).df()
+        else:
+            df = pd.read_sql(query, conn)
         
-        print(f"[SUCCESS] Verification complete")
-        print(f"\n[INFO] First 5 rows from database:")
-        print(df)
+        logger.info("Verification complete")
+        logger.info("First 5 rows from database:\n%s", df)
         
         conn.close()
         
     except Exception as e:
-        print(f"[ERROR] Verification failed: {e}")
+        logger.error("Verification failed: %s", e)
 
 
 # Test the function
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+    
     from extract import extract_data
     from transform import transform_data
     
@@ -4,27 +4,84 @@ Runs the complete data pipeline from raw CSV to validated database
 """
 
 from extract import extract_data
-from transform import transform_data
-from load import load_data, verify_load
+from transform import SeenKeys, transform_data
+from load import BACKENDS, load_data, verify_load, resolve_backend
 from validate import DataValidator
+import argparse
+import logging
 import os
 
-def run_pipeline():
+# Validation rules shared by the in-memory and chunked pipelines
+VALIDATION_RULES = {
+    'expected_columns': ['order_id', 'customer_id', 'product_name',
+                         'quantity', 'price', 'order_date', 'region', 'total_amount'],
+    'critical_columns': ['order_id', 'customer_id', 'product_name', 'quantity', 'price'],
+    'expected_types': {
+        'order_id': 'int',
+        'price': 'float',
+        'quantity': 'int',
+        'total_amount': 'float'
+    },
+    'key_column': 'order_id',
+    'ranges': {
+        'price': (0, 10000),
+        'quantity': (1, 100),
+    },
+}
+
+
+def stream_chunks(raw_file, chunksize, validator):
+    """
+    Extract and transform the file chunk by chunk, feeding each
+    transformed chunk to the validator before yielding it
+    """
+    chunks = extract_data(raw_file, chunksize=chunksize)
+    if chunks is None:
+        raise FileNotFoundError(f"Could not read {raw_file}")
+    
+    seen_ids = SeenKeys()
+    for chunk in chunks:
+        source_rows = len(chunk)
+        df_chunk = transform_data(chunk, seen_ids=seen_ids)
+        validator.check_chunk(df_chunk, source_rows)
+        yield df_chunk
+
+
+def run_pipeline(chunksize=None, backend="sqlite"):
     """
     Execute complete ETL pipeline with validation
+    
+    Args:
+        chunksize: If set, stream the file in chunks of this many rows
+                   instead of reading it into memory at once
+        backend: Warehouse backend, 'sqlite' or 'duckdb' (falls back to
+                 SQLite if duckdb is not installed)
     """
+    # Step-by-step logs are off by default; set PIPELINE_LOG=INFO to see them
+    logging.basicConfig(level=os.environ.get("PIPELINE_LOG", "WARNING").upper(),
+                        format="[%(levelname)s] %(message)s")
+    
     print("\n" + "="*60)
     print(" DATA PIPELINE WITH VALIDATION FRAMEWORK")
     print("="*60)
     
     # Initialize validator
     validator = DataValidator()
+    validator.configure(**VALIDATION_RULES)
     
     # Configuration
     raw_file = "data/raw/sales_data.csv"
-    db_path = "data/warehouse/sales_data.db"
+    backend = resolve_backend(backend)
+    if backend == "duckdb":
+        db_path = "data/warehouse/sales_data.duckdb"
+    else:
+        db_path = "data/warehouse/sales_data.db"
     table_name = "sales"
     
+    if chunksize:
+        return run_chunked_pipeline(validator, raw_file, db_path, table_name,
+                                    backend, chunksize)
+    
     # ===== STEP 1: EXTRACT =====
     print("\n[STEP 1] EXTRACT")
     print("-" * 60)
@@ -37,42 +94,16 @@ def run_pipeline():
     # ===== STEP 2: TRANSFORM =====
     print("\n[STEP 2] TRANSFORM")
     print("-" * 60)
+    # transform_data converts df_raw in place, so keep the source row count first
+    source_rows = len(df_raw)
     df_transformed = transform_data(df_raw)
     
     # ===== STEP 3: VALIDATE =====
     print("\n[STEP 3] VALIDATE")
     print("-" * 60)
     
-    # Schema validation
-    expected_columns = ['order_id', 'customer_id', 'product_name', 
-                       'quantity', 'price', 'order_date', 'region', 'total_amount']
-    validator.schema_validation(df_transformed, expected_columns)
-    
-    # Row count check
-    validator.row_count_check(len(df_raw), len(df_transformed))
-    
-    # Null check
-    critical_columns = ['order_id', 'customer_id', 'product_name', 'quantity', 'price']
-    validator.null_check(df_transformed, critical_columns)
-    
-    # Data type check
-    expected_types = {
-        'order_id': 'int',
-        'price': 'float',
-        'quantity': 'int',
-        'total_amount': 'float'
-    }
-    validator.data_type_check(df_transformed, expected_types)
-    
-    # Duplicate check
-    validator.duplicate_check(df_transformed, 'order_id')
-    
-    # Range checks
-    validator.range_check(df_transformed, 'price', 0, 10000)
-    validator.range_check(df_transformed, 'quantity', 1, 100)
-    
-    # Transformation accuracy
-    validator.transformation_accuracy_check(df_transformed)
+    # Run all checks in one sweep over the transformed data
+    validator.run_all(df_transformed, source_rows)
     
     # Generate validation report
     all_passed = validator.generate_report()
@@ -90,15 +121,15 @@ def run_pipeline():
     os.makedirs("data/warehouse", exist_ok=True)
     
     # Load to database
-    success = load_data(df_transformed, db_path, table_name)
+    success = load_data(df_transformed, db_path, table_name, backend)
     
     if success:
-        verify_load(db_path, table_name)
+        verify_load(db_path, table_name, backend)
         
         print("\n" + "="*60)
         print("✓ PIPELINE COMPLETED SUCCESSFULLY!")
         print("="*60)
-        print(f"✓ Extracted: {len(df_raw)} rows")
+        print(f"✓ Extracted: {source_rows} rows")
         print(f"✓ Transformed: {len(df_transformed)} rows")
         print(f"✓ Validated: 8/8 checks passed")
         print(f"✓ Loaded to: {db_path}")
@@ -109,10 +140,59 @@ def run_pipeline():
         return False
 
 
+def run_chunked_pipeline(validator, raw_file, db_path, table_name, backend, chunksize):
+    """
+    Stream the file through extract, transform, validate and load
+    
+    Chunks are written inside one database transaction while the
+    validator accumulates the schema, dtype and row count checks; the
+    row-level checks then run as one query over the written rows. The
+    transaction is only committed if every check passes, so as in the
+    in-memory pipeline bad data is never left in the database.
+    """
+    print(f"\n[STEP 1-4] EXTRACT, TRANSFORM, VALIDATE, LOAD (chunks of {chunksize} rows)")
+    print("-" * 60)
+    
+    # Create warehouse directory if needed
+    os.makedirs("data/warehouse", exist_ok=True)
+    
+    validator.start_stream()
+    chunks = stream_chunks(raw_file, chunksize, validator)
+    success = load_data(chunks, db_path, table_name, backend,
+                        confirm=lambda conn: validator.finish_stream(conn, table_name))
+    
+    if success:
+        verify_load(db_path, table_name, backend)
+        
+        print("\n" + "="*60)
+        print("✓ PIPELINE COMPLETED SUCCESSFULLY!")
+        print("="*60)
+        print(f"✓ Streamed in chunks of {chunksize} rows")
+        print(f"✓ Validated: 8/8 checks passed")
+        print(f"✓ Loaded to: {db_path}")
+        print("="*60)
+        return True
+    
+    failed = [r for r in validator.validation_results if r['status'] == 'FAILED']
+    if failed:
+        print("\n[ERROR] Validation failed. Data was NOT loaded to database.")
+        print("[INFO] Please fix data quality issues and run again.")
+    else:
+        print("\n[ERROR] Load failed. Pipeline stopped.")
+    return False
+
+
 if __name__ == "__main__":
-    success = run_pipeline()
+    parser = argparse.ArgumentParser(description="Run the ETL pipeline with validation")
+    parser.add_argument("--chunksize", type=int, default=None,
+                        help="Stream the raw file in chunks of this many rows")
+    parser.add_argument("--backend", choices=BACKENDS, default="sqlite",
+                        help="Warehouse backend (default: sqlite)")
+    args = parser.parse_args()
+    
+    success = run_pipeline(chunksize=args.chunksize, backend=args.backend)
     
     if success:
-        print("\n✅ You can now use the data in: data/warehouse/sales_data.db")
+        print("\n✅ You can now use the data in: data/warehouse/")
     else:
-        print("\n❌ Pipeline failed. Check errors above.")
\ No newline at end of file
+        print("\n❌ Pipeline failed. Check errors above.")
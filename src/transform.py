@@ -1,56 +1,165 @@
 import pandas as pd
+import numpy as np
+import logging
 
-def transform_data(df):
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+# Format of order_date in the raw CSV
+DATE_FORMAT = '%Y-%m-%d'
+
+
+def _clean_names(names):
+    """
+    Strip surrounding whitespace and title-case a string column
+    
+    With pyarrow installed and a string dtype column (as extract_data
+    reads it), both steps run as Arrow compute kernels over the UTF-8
+    buffer and the result stays Arrow-backed. Other columns, e.g. object
+    columns holding non-strings or only nulls, use the pandas string methods.
+    """
+    if pa is None or not isinstance(names.dtype, pd.StringDtype):
+        return names.str.strip().str.title()
+    
+    values = pa.array(names, type=pa.string(), from_pandas=True)
+    values = pc.utf8_title(pc.utf8_trim_whitespace(values))
+    return pd.Series(pd.arrays.ArrowStringArray(values), index=names.index, name=names.name)
+
+
+def _whole_numbers(values):
+    """
+    Convert a numeric column to the narrowest integer dtype that holds it
+    when every value is a whole number
+    
+    A column with missing values becomes nullable Int64, so the gaps are
+    reported by the null check alone rather than also failing the data type
+    check. A column with fractional values stays float64.
+    """
+    if values.dtype.kind not in 'iu':
+        array = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        present = array[~np.isnan(array)]
+        if not (np.isfinite(present).all() and (present == np.trunc(present)).all()):
+            return values
+        if present.size < array.size:
+            return values.astype('Int64')
+        values = values.astype(np.int64)
+    
+    # e.g. quantities up to 127 fit in int8, an eighth of the bytes for the
+    # validator to scan
+    return pd.to_numeric(values, downcast='integer')
+
+
+class SeenKeys:
+    """
+    order_id values kept from earlier chunks of a stream
+    
+    Present keys are held in a set, so checking a chunk costs the same
+    however many keys came before it. Missing keys are tracked with a flag
+    instead: each NaN read from a column is a new object that would never
+    match an earlier one, while duplicated() treats missing keys as equal.
+    """
+    
+    def __init__(self):
+        self.keys = set()
+        self.missing = False
+    
+    def isin(self, keys):
+        """Boolean array marking the keys already kept from an earlier chunk"""
+        values = keys.to_numpy()
+        missing = pd.isna(values)
+        found = missing & self.missing
+        present = values[~missing].tolist()
+        found[~missing] = np.fromiter(map(self.keys.__contains__, present),
+                                      dtype=bool, count=len(present))
+        return found
+    
+    def add(self, keys):
+        """Remember the keys kept from a chunk"""
+        values = keys.to_numpy()
+        missing = pd.isna(values)
+        self.missing = self.missing or bool(missing.any())
+        self.keys.update(values[~missing].tolist())
+
+
+def transform_data(df, seen_ids=None):
     """
     Transform and clean the data
     
     Args:
-        df: Input DataFrame
+        df: Input DataFrame. Its columns are converted in place, so the
+            caller should not use it after this call.
+        seen_ids: Optional SeenKeys of order_ids kept from earlier chunks.
+                  Rows repeating one of them are dropped, and the kept
+                  order_ids are added to it.
         
     Returns:
         Cleaned DataFrame
     """
     
-    print("[INFO] Starting data transformation...")
+    logger.info("Starting data transformation...")
     
-    # Make a copy to avoid modifying original
-    df_clean = df.copy()
+    # Work on the input directly instead of copying the whole frame first;
+    # callers hand the raw DataFrame over and must not reuse it afterwards
+    df_clean = df
     
     # Transformation 1: Clean product names (remove extra spaces, title case)
-    print("[INFO] Cleaning product names...")
-    df_clean['product_name'] = df_clean['product_name'].str.strip().str.title()
+    logger.info("Cleaning product names...")
+    df_clean['product_name'] = _clean_names(df_clean['product_name'])
     
     # Transformation 2: Convert price to float (in case it's text)
-    print("[INFO] Converting price to numeric...")
+    logger.info("Converting price to numeric...")
     df_clean['price'] = pd.to_numeric(df_clean['price'], errors='coerce')
     
     # Transformation 3: Convert quantity to integer
-    print("[INFO] Converting quantity to integer...")
-    df_clean['quantity'] = pd.to_numeric(df_clean['quantity'], errors='coerce').astype('Int64')
+    logger.info("Converting quantity to integer...")
+    # Native integers rather than the nullable Int64 extension dtype unless
+    # values are missing, so the validator usually works on plain NumPy arrays
+    df_clean['quantity'] = _whole_numbers(pd.to_numeric(df_clean['quantity'], errors='coerce'))
     
     # Transformation 4: Calculate total amount
-    print("[INFO] Calculating total amount...")
+    # price and total_amount stay float64: float32 keeps only ~7 significant
+    # digits, too few for the accuracy check and the stored amounts
+    logger.info("Calculating total amount...")
     df_clean['total_amount'] = df_clean['quantity'] * df_clean['price']
     
     # Transformation 5: Convert order_date to datetime
-    print("[INFO] Converting order_date to datetime...")
-    df_clean['order_date'] = pd.to_datetime(df_clean['order_date'])
+    # Skipped when extract_data has already parsed the column; a fixed
+    # format avoids guessing the format for every value
+    if df_clean['order_date'].dtype.kind != 'M':
+        logger.info("Converting order_date to datetime...")
+        df_clean['order_date'] = pd.to_datetime(df_clean['order_date'],
+                                                format=DATE_FORMAT, cache=True)
     
     # Transformation 6: Remove duplicates based on order_id
-    print("[INFO] Removing duplicates...")
+    logger.info("Removing duplicates...")
     before_count = len(df_clean)
-    df_clean = df_clean.drop_duplicates(subset='order_id', keep='first')
+    # Mark repeats from the key column alone and only filter the frame when
+    # there is something to drop, so a file without duplicates is not copied
+    repeated = df_clean['order_id'].duplicated(keep='first').to_numpy()
+    if seen_ids is not None:
+        repeated = repeated | seen_ids.isin(df_clean['order_id'])
+    if repeated.any():
+        df_clean = df_clean[~repeated]
+    if seen_ids is not None:
+        seen_ids.add(df_clean['order_id'])
     after_count = len(df_clean)
     duplicates_removed = before_count - after_count
-    print(f"[INFO] Removed {duplicates_removed} duplicate rows")
+    logger.info("Removed %s duplicate rows", duplicates_removed)
     
-    print(f"[SUCCESS] Transformation complete! {len(df_clean)} rows ready")
+    logger.info("Transformation complete! %s rows ready", len(df_clean))
     
     return df_clean
 
 
 # Test the function
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+    
     from extract import extract_data
     
     # Extract data first
@@ -1,7 +1,197 @@
 import pandas as pd
+import numpy as np
 import sqlite3
+import logging
+import os
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+# Tolerance for total_amount == quantity * price
+ACCURACY_RTOL = 1e-9
+ACCURACY_ATOL = 1e-6
+
+# Largest finite float64, for telling infinities apart in SQL
+MAX_FLOAT = float(np.finfo(np.float64).max)
+
+# Rows from which fast_sweep uses the Numba kernel, when numba is installed.
+# Importing numba and loading the compiled kernel costs about a second, and
+# the kernel saves about 20ms per million rows over the NumPy reductions.
+NUMBA_MIN_ROWS = 50_000_000
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_sweep():
+    """Import the Numba kernel on first use, or return None if numba is not installed"""
+    try:
+        from validate_numba import sweep
+    except ImportError:
+        return None
+    return sweep
+
+
+def _numeric_values(series):
+    """
+    Return a numeric column as a NumPy array, with missing values as NaN
+    
+    NumPy-backed columns are returned without copying; nullable extension
+    columns (e.g. Int64) are converted to float64.
+    """
+    if isinstance(series.dtype, np.dtype):
+        return series.to_numpy()
+    return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _schema_diff(df, expected_columns):
+    """
+    Return the (missing, extra) columns of a DataFrame as Index objects
+    
+    expected_columns should be a pandas Index (configure() keeps one), so
+    both differences use the Index hash tables instead of building sets.
+    """
+    missing = expected_columns.difference(df.columns, sort=False)
+    extra = df.columns.difference(expected_columns, sort=False)
+    return missing, extra
+
+
+# dtype.kind codes accepted for each expected type name in data_type_check.
+# Nullable (Int64, Float64) and Arrow-backed dtypes report the same kinds as
+# their NumPy counterparts.
+DTYPE_KINDS = {
+    'int': {'i', 'u'},
+    'float': {'f'},
+    'bool': {'b'},
+    'datetime': {'M'},
+}
+
+
+def _type_failures(df, expected_types):
+    """Return a message for each column whose dtype does not match"""
+    failures = []
+    for column, expected_type in expected_types.items():
+        dtype = df[column].dtype
+        if dtype.kind not in DTYPE_KINDS.get(expected_type.lower(), ()):
+            failures.append(f"{column}: expected {expected_type}, got {dtype}")
+    return failures
+
+
+def _duplicate_count(series):
+    """Count values that repeat an earlier value in the column"""
+    keys = series.to_numpy()
+    if keys.dtype.kind in 'iu':
+        # Integer keys have no missing values: after sorting, every value
+        # equal to its predecessor is a repeat
+        return int(np.count_nonzero(np.diff(np.sort(keys)) == 0))
+    return int(keys.size - pd.unique(keys).size)
+
+
+def _out_of_range_count(values, min_val, max_val):
+    """Count values outside [min_val, max_val], ignoring missing values"""
+    return int(np.count_nonzero((values < min_val) | (values > max_val)))
+
+
+def _mismatch_count(quantity, price, total):
+    """Count rows where total != quantity * price"""
+    # Compare within floating point tolerance, missing values are
+    # reported by the null check instead
+    return int(np.count_nonzero(
+        ~np.isclose(total, quantity * price, rtol=ACCURACY_RTOL, atol=ACCURACY_ATOL,
+                    equal_nan=True)
+    ))
+
+
+def _numeric_arrays(df, rules):
+    """
+    Convert each numeric column the checks read to a NumPy array once
+    
+    The arrays are shared by the null, range and accuracy checks instead of
+    every check going back to the DataFrame.
+    """
+    numeric_columns = list(rules['ranges']) + ['quantity', 'price', 'total_amount']
+    return {column: _numeric_values(df[column]) for column in numeric_columns}
+
+
+def _null_counts(df, columns, values):
+    """Count nulls per column, using the shared arrays where available"""
+    null_counts = {}
+    for column in columns:
+        if column in values:
+            column_values = values[column]
+            null_counts[column] = (int(np.count_nonzero(np.isnan(column_values)))
+                                   if column_values.dtype.kind == 'f' else 0)
+        else:
+            null_counts[column] = int(df[column].isnull().sum())
+    return pd.Series(null_counts, dtype='int64')
+
+
+def _row_counts(df, rules, values, pool):
+    """
+    Null, range and accuracy counts with NumPy, one pool task per check
+    
+    The reductions release the GIL, so the tasks run side by side.
+    
+    Returns:
+        (null_counts Series, {column: out_of_range_count}, mismatch_count)
+    """
+    null_counts = pool.submit(_null_counts, df, rules['critical_columns'], values)
+    out_of_range = {
+        column: pool.submit(_out_of_range_count, values[column], min_val, max_val)
+        for column, (min_val, max_val) in rules['ranges'].items()
+    }
+    mismatches = pool.submit(_mismatch_count, values['quantity'],
+                             values['price'], values['total_amount'])
+    return (null_counts.result(),
+            {column: count.result() for column, count in out_of_range.items()},
+            mismatches.result())
+
+
+def _database_counts(conn, table_name, rules):
+    """
+    Null, duplicate, range and accuracy counts for a loaded table
+    
+    All counts come from one aggregate query, so the database makes a
+    single pass over the rows. Works with sqlite3 and DuckDB connections.
+    Missing values are treated as in the DataFrame checks: they count as
+    one value for duplicates and are ignored by the range check.
+    
+    Returns:
+        (null_counts Series, duplicate_count, {column: out_of_range_count},
+         mismatch_count)
+    """
+    critical = rules['critical_columns']
+    key = f'"{rules["key_column"]}"'
+    
+    terms = [f'SUM(CASE WHEN "{column}" IS NULL THEN 1 ELSE 0 END)' for column in critical]
+    terms.append(f"COUNT(*) - COUNT(DISTINCT {key}) - MAX(CASE WHEN {key} IS NULL THEN 1 ELSE 0 END)")
+    params = []
+    for column, (min_val, max_val) in rules['ranges'].items():
+        terms.append(f'SUM(CASE WHEN "{column}" < ? OR "{column}" > ? THEN 1 ELSE 0 END)')
+        params += [min_val, max_val]
+    terms.append(
+        'SUM(CASE WHEN ("total_amount" IS NULL) <> ("quantity" * "price" IS NULL) THEN 1 '
+        # Infinities are handled before the tolerance test, as in np.isclose:
+        # equal ones match (inf - inf is NaN, which DuckDB compares as
+        # greater than any number) and any other one is a mismatch (the
+        # tolerance itself would be infinite)
+        'WHEN "total_amount" = "quantity" * "price" THEN 0 '
+        f'WHEN ABS("total_amount") > {MAX_FLOAT!r} OR ABS("quantity" * "price") > {MAX_FLOAT!r} THEN 1 '
+        f'WHEN ABS("total_amount" - "quantity" * "price") > {ACCURACY_ATOL} + {ACCURACY_RTOL} * ABS("quantity" * "price") '
+        'THEN 1 ELSE 0 END)'
+    )
+    
+    row = conn.execute(f"SELECT {', '.join(terms)} FROM {table_name}", params).fetchone()
+    counts = [int(value or 0) for value in row]
+    
+    null_counts = pd.Series(counts[:len(critical)], index=critical, dtype='int64')
+    duplicate_count = counts[len(critical)]
+    range_counts = counts[len(critical) + 1:-1]
+    out_of_range = dict(zip(rules['ranges'], range_counts))
+    return null_counts, duplicate_count, out_of_range, counts[-1]
+
+
 class DataValidator:
     """
     Validates data quality at each step of ETL pipeline
@@ -9,35 +199,38 @@ class DataValidator:
     
     def __init__(self):
         self.validation_results = []
+        self._rules = None
+        self._expected_index = None
+        self._stream = None
+        self._lock = threading.Lock()
         
     def add_result(self, check_name, status, message):
-        """Add a validation result"""
-        self.validation_results.append({
-            'check': check_name,
-            'status': status,
-            'message': message,
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        })
+        """Add a validation result (safe to call from several threads)"""
+        with self._lock:
+            self.validation_results.append({
+                'check': check_name,
+                'status': status,
+                'message': message,
+                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            })
         
     def schema_validation(self, df, expected_columns):
         """
         Check if DataFrame has expected columns
         """
-        print("\n[VALIDATION] Schema Check")
-        print("-" * 50)
-        
-        actual_columns = list(df.columns)
-        missing = set(expected_columns) - set(actual_columns)
-        extra = set(actual_columns) - set(expected_columns)
-        
+        missing, extra = _schema_diff(df, pd.Index(expected_columns))
+        return self._report_schema(missing, extra, len(expected_columns))
+    
+    def _report_schema(self, missing, extra, expected_count):
+        """Log and record the schema check result"""
         if len(missing) == 0 and len(extra) == 0:
-            print("✓ PASSED: All expected columns present")
+            logger.info("✓ Schema Check PASSED: All expected columns present")
             self.add_result("Schema Validation", "PASSED", 
-                          f"All {len(expected_columns)} columns present")
+                          f"All {expected_count} columns present")
             return True
         else:
-            msg = f"Missing: {missing}, Extra: {extra}"
-            print(f"✗ FAILED: {msg}")
+            msg = f"Missing: {set(missing)}, Extra: {set(extra)}"
+            logger.warning("✗ Schema Check FAILED: %s", msg)
             self.add_result("Schema Validation", "FAILED", msg)
             return False
     
@@ -45,17 +238,14 @@ class DataValidator:
         """
         Check if row counts match between source and target
         """
-        print("\n[VALIDATION] Row Count Check")
-        print("-" * 50)
-        
         if source_count == target_count:
-            print(f"✓ PASSED: Row count matches ({source_count} rows)")
+            logger.info("✓ Row Count Check PASSED: Row count matches (%s rows)", source_count)
             self.add_result("Row Count Check", "PASSED", 
                           f"Source: {source_count}, Target: {target_count}")
             return True
         else:
             msg = f"Mismatch! Source: {source_count}, Target: {target_count}"
-            print(f"✗ FAILED: {msg}")
+            logger.warning("✗ Row Count Check FAILED: %s", msg)
             self.add_result("Row Count Check", "FAILED", msg)
             return False
     
@@ -63,20 +253,21 @@ class DataValidator:
         """
         Check for null values in specified columns
         """
-        print("\n[VALIDATION] Null Value Check")
-        print("-" * 50)
-        
         null_counts = df[columns_to_check].isnull().sum()
+        return self._report_nulls(null_counts, len(columns_to_check))
+    
+    def _report_nulls(self, null_counts, column_count):
+        """Log and record the null value check result"""
         has_nulls = null_counts.sum() > 0
         
         if not has_nulls:
-            print("✓ PASSED: No null values found")
+            logger.info("✓ Null Value Check PASSED: No null values found")
             self.add_result("Null Check", "PASSED", 
-                          f"No nulls in {len(columns_to_check)} columns")
+                          f"No nulls in {column_count} columns")
             return True
         else:
             msg = f"Found nulls: {dict(null_counts[null_counts > 0])}"
-            print(f"✗ FAILED: {msg}")
+            logger.warning("✗ Null Value Check FAILED: %s", msg)
             self.add_result("Null Check", "FAILED", msg)
             return False
     
@@ -84,26 +275,19 @@ class DataValidator:
         """
         Check if columns have expected data types
         """
-        print("\n[VALIDATION] Data Type Check")
-        print("-" * 50)
-        
-        failures = []
-        for column, expected_type in expected_types.items():
-            actual_type = str(df[column].dtype).lower()  # Convert to lowercase
-            expected_lower = expected_type.lower()        # Convert to lowercase
-            
-            # Check if expected type is in actual type (flexible matching)
-            if expected_lower not in actual_type:
-                failures.append(f"{column}: expected {expected_type}, got {df[column].dtype}")
-        
+        failures = _type_failures(df, expected_types)
+        return self._report_types(failures, len(expected_types))
+    
+    def _report_types(self, failures, type_count):
+        """Log and record the data type check result"""
         if len(failures) == 0:
-            print("✓ PASSED: All data types correct")
+            logger.info("✓ Data Type Check PASSED: All data types correct")
             self.add_result("Data Type Check", "PASSED", 
-                          f"All {len(expected_types)} columns have correct types")
+                          f"All {type_count} columns have correct types")
             return True
         else:
             msg = "; ".join(failures)
-            print(f"✗ FAILED: {msg}")
+            logger.warning("✗ Data Type Check FAILED: %s", msg)
             self.add_result("Data Type Check", "FAILED", msg)
             return False
     
@@ -111,19 +295,19 @@ class DataValidator:
         """
         Check for duplicate values in key column
         """
-        print("\n[VALIDATION] Duplicate Check")
-        print("-" * 50)
-        
-        duplicate_count = df[key_column].duplicated().sum()
-        
+        duplicate_count = _duplicate_count(df[key_column])
+        return self._report_duplicates(duplicate_count, key_column)
+    
+    def _report_duplicates(self, duplicate_count, key_column):
+        """Log and record the duplicate check result"""
         if duplicate_count == 0:
-            print("✓ PASSED: No duplicates found")
+            logger.info("✓ Duplicate Check PASSED: No duplicates found")
             self.add_result("Duplicate Check", "PASSED", 
                           f"No duplicates in {key_column}")
             return True
         else:
             msg = f"Found {duplicate_count} duplicates in {key_column}"
-            print(f"✗ FAILED: {msg}")
+            logger.warning("✗ Duplicate Check FAILED: %s", msg)
             self.add_result("Duplicate Check", "FAILED", msg)
             return False
     
@@ -131,19 +315,20 @@ class DataValidator:
         """
         Check if values are within expected range
         """
-        print(f"\n[VALIDATION] Range Check ({column})")
-        print("-" * 50)
-        
-        out_of_range = df[(df[column] < min_val) | (df[column] > max_val)]
-        
-        if len(out_of_range) == 0:
-            print(f"✓ PASSED: All values in range [{min_val}, {max_val}]")
+        out_of_range_count = _out_of_range_count(_numeric_values(df[column]), min_val, max_val)
+        return self._report_range(out_of_range_count, column, min_val, max_val)
+    
+    def _report_range(self, out_of_range_count, column, min_val, max_val):
+        """Log and record the range check result"""
+        if out_of_range_count == 0:
+            logger.info("✓ Range Check (%s) PASSED: All values in range [%s, %s]",
+                        column, min_val, max_val)
             self.add_result(f"Range Check ({column})", "PASSED", 
                           f"All values between {min_val} and {max_val}")
             return True
         else:
-            msg = f"Found {len(out_of_range)} values out of range"
-            print(f"✗ FAILED: {msg}")
+            msg = f"Found {out_of_range_count} values out of range"
+            logger.warning("✗ Range Check (%s) FAILED: %s", column, msg)
             self.add_result(f"Range Check ({column})", "FAILED", msg)
             return False
     
@@ -151,24 +336,224 @@ class DataValidator:
         """
         Verify transformation calculations are correct
         """
-        print("\n[VALIDATION] Transformation Accuracy Check")
-        print("-" * 50)
-        
-        # Check if total_amount = quantity * price
-        df['calculated_total'] = df['quantity'] * df['price']
-        mismatch = df[df['total_amount'] != df['calculated_total']]
-        
-        if len(mismatch) == 0:
-            print("✓ PASSED: total_amount calculations correct")
+        mismatch_count = _mismatch_count(_numeric_values(df['quantity']),
+                                         _numeric_values(df['price']),
+                                         _numeric_values(df['total_amount']))
+        return self._report_accuracy(mismatch_count)
+    
+    def _report_accuracy(self, mismatch_count):
+        """Log and record the transformation accuracy check result"""
+        if mismatch_count == 0:
+            logger.info("✓ Transformation Accuracy Check PASSED: total_amount calculations correct")
             self.add_result("Transformation Accuracy", "PASSED", 
                           "All total_amount = quantity × price")
             return True
         else:
-            msg = f"Found {len(mismatch)} rows with incorrect calculations"
-            print(f"✗ FAILED: {msg}")
+            msg = f"Found {mismatch_count} rows with incorrect calculations"
+            logger.warning("✗ Transformation Accuracy Check FAILED: %s", msg)
             self.add_result("Transformation Accuracy", "FAILED", msg)
             return False
     
+    def configure(self, expected_columns, critical_columns, expected_types,
+                  key_column, ranges):
+        """
+        Set the rules used by run_all and the chunked checks
+        
+        Called once before validating, so anything derived from the rules
+        is built here instead of on every call or chunk.
+        
+        Args:
+            expected_columns: Columns the transformed data must have
+            critical_columns: Columns that must not contain nulls
+            expected_types: {column: 'int' | 'float' | 'bool' | 'datetime'}
+            key_column: Column that must be unique
+            ranges: {column: (min_val, max_val)}
+        """
+        self._rules = {
+            'expected_columns': list(expected_columns),
+            'critical_columns': list(critical_columns),
+            'expected_types': dict(expected_types),
+            'key_column': key_column,
+            'ranges': dict(ranges),
+        }
+        self._expected_index = pd.Index(expected_columns)
+    
+    def _configured_rules(self):
+        """Return the rules set by configure()"""
+        if self._rules is None:
+            raise RuntimeError("DataValidator.configure() must be called first")
+        return self._rules
+    
+    def fast_sweep(self, df, values=None, pool=None):
+        """
+        Null, range and accuracy counts for the configured rules
+        
+        For frames of at least NUMBA_MIN_ROWS rows, with numba installed,
+        quantity, price and total_amount are checked in one compiled pass;
+        any other critical or range columns, and smaller frames, use the
+        NumPy reductions.
+        
+        Args:
+            df: Transformed DataFrame
+            values: Arrays from _numeric_arrays, built here if not given
+            pool: Executor for the NumPy reductions, created here if not given
+            
+        Returns:
+            (null_counts Series, {column: out_of_range_count}, mismatch_count)
+        """
+        rules = self._configured_rules()
+        if values is None:
+            values = _numeric_arrays(df, rules)
+        
+        sweep = _numba_sweep() if len(df) >= NUMBA_MIN_ROWS else None
+        if sweep is None:
+            if pool is None:
+                with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                    return _row_counts(df, rules, values, pool)
+            return _row_counts(df, rules, values, pool)
+        
+        ranges = rules['ranges']
+        qmin, qmax = ranges.get('quantity', (-np.inf, np.inf))
+        pmin, pmax = ranges.get('price', (-np.inf, np.inf))
+        # Always float64, so downcast or nullable columns do not compile
+        # the kernel again for each new dtype combination
+        q_nulls, p_nulls, q_bad, p_bad, mismatches = sweep(
+            np.asarray(values['quantity'], dtype=np.float64),
+            np.asarray(values['price'], dtype=np.float64),
+            np.asarray(values['total_amount'], dtype=np.float64),
+            float(qmin), float(qmax), float(pmin), float(pmax),
+            ACCURACY_RTOL, ACCURACY_ATOL
+        )
+        swept_nulls = {'quantity': q_nulls, 'price': p_nulls}
+        swept_ranges = {'quantity': q_bad, 'price': p_bad}
+        
+        critical = rules['critical_columns']
+        other_nulls = _null_counts(df, [c for c in critical if c not in swept_nulls], values)
+        null_counts = pd.Series(
+            {c: swept_nulls[c] if c in swept_nulls else other_nulls[c] for c in critical},
+            dtype='int64'
+        )
+        out_of_range = {
+            column: (swept_ranges[column] if column in swept_ranges
+                     else _out_of_range_count(values[column], min_val, max_val))
+            for column, (min_val, max_val) in ranges.items()
+        }
+        return null_counts, out_of_range, int(mismatches)
+    
+    def run_all(self, df, source_count):
+        """
+        Run every check on a transformed DataFrame in one sweep
+        
+        The numeric columns are read once and shared between the null,
+        range and accuracy checks (see fast_sweep), which run alongside the
+        duplicate check in a thread pool. Results are
+        reported in the same order as calling the individual checks.
+        
+        Args:
+            df: Transformed DataFrame
+            source_count: Number of rows before transformation
+            
+        Returns:
+            Boolean: True if every check passed
+        """
+        rules = self._configured_rules()
+        values = _numeric_arrays(df, rules)
+        
+        # The duplicate count runs in the pool next to the other row-level
+        # counts; results are reported from this thread in order
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            duplicate_count = pool.submit(_duplicate_count, df[rules['key_column']])
+            null_counts, out_of_range, mismatches = self.fast_sweep(df, values, pool)
+            
+            missing, extra = _schema_diff(df, self._expected_index)
+            type_failures = _type_failures(df, rules['expected_types'])
+        
+        results = [
+            self._report_schema(missing, extra, len(rules['expected_columns'])),
+            self.row_count_check(source_count, len(df)),
+            self._report_nulls(null_counts, len(rules['critical_columns'])),
+            self._report_types(type_failures, len(rules['expected_types'])),
+            self._report_duplicates(duplicate_count.result(), rules['key_column']),
+        ]
+        for column, (min_val, max_val) in rules['ranges'].items():
+            results.append(self._report_range(out_of_range[column],
+                                              column, min_val, max_val))
+        results.append(self._report_accuracy(mismatches))
+        
+        return all(results)
+    
+    def start_stream(self):
+        """
+        Start accumulating checks over a stream of DataFrame chunks
+        
+        Schema, dtype and row count checks are gathered from each chunk;
+        the row-level checks run in the database once every chunk has been
+        written (see finish_stream). Uses the rules set by configure().
+        """
+        self._configured_rules()
+        self._stream = {
+            'source_rows': 0,
+            'target_rows': 0,
+            'missing': set(),
+            'extra': set(),
+            'type_failures': {},
+        }
+    
+    def check_chunk(self, df, source_rows):
+        """
+        Add one transformed chunk to the running check totals
+        
+        Args:
+            df: Transformed chunk
+            source_rows: Number of raw rows the chunk was built from
+        """
+        stream = self._stream
+        rules = self._rules
+        
+        stream['source_rows'] += source_rows
+        stream['target_rows'] += len(df)
+        
+        missing, extra = _schema_diff(df, self._expected_index)
+        stream['missing'].update(missing)
+        stream['extra'].update(extra)
+        
+        for failure in _type_failures(df, rules['expected_types']):
+            stream['type_failures'][failure] = None
+    
+    def finish_stream(self, conn, table_name):
+        """
+        Report the checks for all chunks
+        
+        The null, duplicate, range and accuracy checks are answered by one
+        query over the rows already written to the (uncommitted) table, so
+        no running state is kept in Python for them.
+        
+        Args:
+            conn: Open sqlite3 or DuckDB connection the chunks were written with
+            table_name: Table the chunks were written to
+            
+        Returns:
+            Boolean: True if all validations passed (see generate_report)
+        """
+        stream = self._stream
+        rules = self._rules
+        self._stream = None
+        
+        null_counts, duplicate_count, out_of_range, mismatches = \
+            _database_counts(conn, table_name, rules)
+        
+        self._report_schema(stream['missing'], stream['extra'],
+                            len(rules['expected_columns']))
+        self.row_count_check(stream['source_rows'], stream['target_rows'])
+        self._report_nulls(null_counts, len(rules['critical_columns']))
+        self._report_types(list(stream['type_failures']), len(rules['expected_types']))
+        self._report_duplicates(duplicate_count, rules['key_column'])
+        for column, (min_val, max_val) in rules['ranges'].items():
+            self._report_range(out_of_range[column], column, min_val, max_val)
+        self._report_accuracy(mismatches)
+        
+        return self.generate_report()
+    
     def generate_report(self):
         """
         Generate validation report
@@ -206,6 +591,8 @@ if __name__ == "__main__":
     from extract import extract_data
     from transform import transform_data
     
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+    
     print("="*50)
     print("RUNNING DATA VALIDATION")
     print("="*50)
@@ -218,7 +605,8 @@ if __name__ == "__main__":
     df_raw = extract_data(file_path)
     
     if df_raw is not None:
-        # 2. Transform data
+        # 2. Transform data (in place, so keep the source row count first)
+        source_rows = len(df_raw)
         df_transformed = transform_data(df_raw)
         
         # 3. Run validations
@@ -229,7 +617,7 @@ if __name__ == "__main__":
         validator.schema_validation(df_transformed, expected_columns)
         
         # Row count check
-        validator.row_count_check(len(df_raw), len(df_transformed))
+        validator.row_count_check(source_rows, len(df_transformed))
         
         # Null check
         critical_columns = ['order_id', 'customer_id', 'product_name', 'quantity', 'price']
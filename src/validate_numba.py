@@ -0,0 +1,65 @@
+"""
+Numba kernel for the validator's row-level checks on quantity, price and total_amount
+
+Importing this module requires numba. validate.py imports it lazily, only for
+large frames, and falls back to the NumPy checks when it is not installed.
+"""
+
+import math
+
+from numba import njit, prange
+
+
+# fastmath is left off: its no-NaN assumption would compile the
+# `x != x` missing value tests away
+@njit(parallel=True, cache=True)
+def sweep(q, p, t, qmin, qmax, pmin, pmax, rtol, atol):
+    """
+    Null, range and accuracy counts in one parallel pass over the rows
+    
+    Follows the NumPy checks exactly: missing values are counted as nulls
+    and skipped by the range checks, a total only matches a missing
+    quantity * price when it is missing too, and an infinite value only
+    matches an equal one.
+    
+    Args:
+        q, p, t: quantity, price and total_amount arrays (missing values as NaN)
+        qmin, qmax: Allowed quantity range
+        pmin, pmax: Allowed price range
+        rtol, atol: Tolerance for total_amount == quantity * price
+    
+    Returns:
+        (quantity nulls, price nulls, quantity out of range,
+         price out of range, total_amount mismatches)
+    """
+    n_q_null = 0
+    n_p_null = 0
+    n_q_bad = 0
+    n_p_bad = 0
+    n_t_bad = 0
+    for i in prange(q.shape[0]):
+        qi = q[i]
+        pi = p[i]
+        ti = t[i]
+        
+        if qi != qi:
+            n_q_null += 1
+        elif qi < qmin or qi > qmax:
+            n_q_bad += 1
+        
+        if pi != pi:
+            n_p_null += 1
+        elif pi < pmin or pi > pmax:
+            n_p_bad += 1
+        
+        expected = qi * pi
+        if expected != expected or ti != ti:
+            if (expected != expected) != (ti != ti):
+                n_t_bad += 1
+        elif ti == expected:
+            pass
+        elif math.isinf(ti) or math.isinf(expected):
+            n_t_bad += 1
+        elif abs(ti - expected) > atol + rtol * abs(expected):
+            n_t_bad += 1
+    return n_q_null, n_p_null, n_q_bad, n_p_bad, n_t_bad
@@ -0,0 +1,23 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from extract import extract_data
+
+
+def test_blank_integer_cell_is_read_as_missing(tmp_path):
+    """A blank cell in an integer column must reach the null check, not fail the read"""
+    csv_file = tmp_path / "sales_data.csv"
+    csv_file.write_text(
+        "order_id,customer_id,product_name,quantity,price,order_date,region\n"
+        "1,101,mouse,10,19.99,2024-01-01,East\n"
+        "2,,laptop,,45.25,2024-01-02,West\n"
+    )
+    
+    df = extract_data(str(csv_file))
+    
+    assert df is not None
+    assert len(df) == 2
+    assert df['quantity'].isna().sum() == 1
+    assert df['customer_id'].isna().sum() == 1
@@ -0,0 +1,57 @@
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from transform import SeenKeys, _clean_names, transform_data
+
+
+def _orders(order_ids):
+    """Minimal raw chunk with the given order_ids"""
+    return pd.DataFrame({
+        'order_id': order_ids,
+        'product_name': 'mouse',
+        'quantity': 1,
+        'price': 1.0,
+        'order_date': pd.Timestamp('2024-01-01'),
+    })
+
+
+def test_clean_names_accepts_object_columns():
+    """All-null and mixed object columns are cleaned like the pandas string methods do"""
+    for names in (pd.Series([None, None], dtype=object), pd.Series([' mouse ', 5], dtype=object)):
+        expected = names.str.strip().str.title()
+        pd.testing.assert_series_equal(_clean_names(names), expected)
+
+
+def test_cross_chunk_duplicates_match_duplicated():
+    """Keys repeated across chunks, missing ones included, are dropped like duplicated() does"""
+    chunks = [[1.0, np.nan, np.nan], [np.nan, 2.0, 1.0], [3.0, 2.0, 5.0]]
+    seen_ids = SeenKeys()
+    
+    kept = [len(transform_data(_orders(chunk), seen_ids=seen_ids)) for chunk in chunks]
+    
+    expected = (~pd.Series(sum(chunks, [])).duplicated()).sum()
+    assert kept == [2, 1, 2]
+    assert sum(kept) == expected
+
+
+def test_seen_keys_cost_does_not_grow_with_stream_length():
+    """Checking a chunk must not get slower as more chunks have been seen"""
+    chunk_count = 200
+    keys = np.random.default_rng(0).permutation(chunk_count * 5_000)
+    seen_ids = SeenKeys()
+    
+    timings = []
+    for chunk in np.array_split(keys, chunk_count):
+        chunk = pd.Series(chunk)
+        start = time.perf_counter()
+        repeated = seen_ids.isin(chunk)
+        seen_ids.add(chunk[~repeated])
+        timings.append(time.perf_counter() - start)
+    
+    assert np.median(timings[-20:]) < 3 * np.median(timings[:20])
@@ -0,0 +1,126 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import validate
+from load import load_data
+from pipeline import VALIDATION_RULES
+from validate import DataValidator
+
+
+def _dirty_orders():
+    """Transformed-looking frame with a null, a NaN, Int64 gaps, repeats and bad totals"""
+    quantity = pd.array([2, None, 150, 3, 1, 4], dtype='Int64')
+    price = pd.Series([10.0, 5.0, 1.0, np.nan, -2.0, 2.5])
+    df = pd.DataFrame({
+        'order_id': [1, 2, 2, 3, 4, 5],
+        'customer_id': [101, None, 103, 104, 105, 106],
+        'product_name': ['Mouse', 'Laptop', None, 'Keyboard', 'Mouse', 'Monitor'],
+        'quantity': quantity,
+        'price': price,
+        'order_date': pd.to_datetime(['2024-01-01'] * 6),
+        'region': ['East'] * 6,
+    })
+    df['total_amount'] = (df['quantity'] * df['price']).astype('float64')
+    df.loc[5, 'total_amount'] = 99.0
+    return df
+
+
+def _infinite_orders():
+    """_dirty_orders plus an infinite price with a matching and a mismatched total"""
+    df = _dirty_orders()
+    extra = pd.DataFrame({
+        'order_id': [6, 7],
+        'customer_id': [107.0, 108.0],
+        'product_name': ['Mouse', 'Mouse'],
+        'quantity': pd.array([2, 2], dtype='Int64'),
+        'price': [np.inf, np.inf],
+        'order_date': pd.to_datetime(['2024-01-02'] * 2),
+        'region': ['West'] * 2,
+        'total_amount': [np.inf, 5.0],
+    })
+    return pd.concat([df, extra], ignore_index=True)
+
+
+def _messages(validator):
+    """(check, status, message) for every recorded result"""
+    return [(r['check'], r['status'], r['message']) for r in validator.validation_results]
+
+
+def _individual_checks(df, source_count):
+    """Results of calling each check on its own, as the validate.py demo does"""
+    validator = DataValidator()
+    validator.schema_validation(df, VALIDATION_RULES['expected_columns'])
+    validator.row_count_check(source_count, len(df))
+    validator.null_check(df, VALIDATION_RULES['critical_columns'])
+    validator.data_type_check(df, VALIDATION_RULES['expected_types'])
+    validator.duplicate_check(df, VALIDATION_RULES['key_column'])
+    for column, (min_val, max_val) in VALIDATION_RULES['ranges'].items():
+        validator.range_check(df, column, min_val, max_val)
+    validator.transformation_accuracy_check(df)
+    return _messages(validator)
+
+
+@pytest.mark.parametrize("use_numba", [False, True])
+def test_run_all_matches_individual_checks(monkeypatch, use_numba):
+    """run_all reports what the individual checks report, with and without the Numba kernel"""
+    if use_numba:
+        pytest.importorskip("numba")
+        monkeypatch.setattr(validate, "NUMBA_MIN_ROWS", 0)
+    else:
+        monkeypatch.setattr(validate, "NUMBA_MIN_ROWS", sys.maxsize)
+    df = _infinite_orders()
+    
+    validator = DataValidator()
+    validator.configure(**VALIDATION_RULES)
+    validator.run_all(df, len(df))
+    
+    assert _messages(validator) == _individual_checks(df, len(df))
+
+
+def test_fast_sweep_counts_with_and_without_numba(monkeypatch):
+    """Nulls, NaN and Int64 gaps are counted the same by the kernel and the NumPy path"""
+    pytest.importorskip("numba")
+    df = _dirty_orders()
+    validator = DataValidator()
+    validator.configure(**VALIDATION_RULES)
+    
+    monkeypatch.setattr(validate, "NUMBA_MIN_ROWS", sys.maxsize)
+    null_counts, out_of_range, mismatches = validator.fast_sweep(df)
+    monkeypatch.setattr(validate, "NUMBA_MIN_ROWS", 0)
+    numba_counts = validator.fast_sweep(df)
+    
+    assert null_counts.to_dict() == {'order_id': 0, 'customer_id': 1, 'product_name': 1,
+                                     'quantity': 1, 'price': 1}
+    assert out_of_range == {'price': 1, 'quantity': 1}
+    assert mismatches == 1
+    pd.testing.assert_series_equal(numba_counts[0], null_counts)
+    assert numba_counts[1:] == (out_of_range, mismatches)
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "duckdb"])
+def test_database_counts_match_run_all(tmp_path, backend):
+    """The chunked pipeline's in-database checks report what run_all reports"""
+    if backend == "duckdb":
+        pytest.importorskip("duckdb")
+    df = _infinite_orders()
+    
+    in_memory = DataValidator()
+    in_memory.configure(**VALIDATION_RULES)
+    in_memory.run_all(df, len(df))
+    
+    streamed = DataValidator()
+    streamed.configure(**VALIDATION_RULES)
+    streamed.start_stream()
+    chunks = [df.iloc[:4], df.iloc[4:]]
+    for chunk in chunks:
+        streamed.check_chunk(chunk, len(chunk))
+    load_data(chunks, str(tmp_path / "warehouse.db"), "sales", backend,
+              confirm=lambda conn: streamed.finish_stream(conn, "sales"))
+    
+    assert _messages(streamed) == _messages(in_memory)